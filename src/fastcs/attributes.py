@@ -191,8 +191,12 @@ class AttrW(Attribute[T]):
             self._sender = SimpleHandler()
 
     async def process(self, value: T) -> None:
-        await self.process_without_display_update(value)
-        await self.update_display_without_process(value)
+        # Validate once and pass the result to both callbacks
+        value = self._datatype.validate(value)
+        if self._process_callback is not None:
+            await self._process_callback(value)
+        if self._write_display_callback is not None:
+            await self._write_display_callback(value)
 
     async def process_without_display_update(self, value: T) -> None:
         if self._process_callback is not None:
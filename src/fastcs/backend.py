@@ -19,10 +19,18 @@ class Backend:
     ):
         self.dispatcher = AsyncioDispatcher(loop)
         self._loop = self.dispatcher.loop
+        # Let tasks that finish without suspending, such as most record puts,
+        # complete without a trip through the event loop (Python 3.12+). The loop
+        # is already running in the dispatcher thread, so install it from there.
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if loop is None and eager_task_factory is not None:
+            self._loop.call_soon_threadsafe(
+                self._loop.set_task_factory, eager_task_factory
+            )
         self._controller = controller
 
         self._initial_coros = [controller.connect]
-        self._scan_futures: set[Future] = set()
+        self._scan_future: Future | None = None
 
         asyncio.run_coroutine_threadsafe(
             self._controller.initialise(), self._loop
@@ -48,18 +56,17 @@ class Backend:
             future.result()
 
     def start_scan_futures(self):
-        self._scan_futures = {
-            asyncio.run_coroutine_threadsafe(coro(), self._loop)
-            for coro in _get_scan_coros(self._controller)
-        }
+        # Submit all periodic scans to the loop as one future rather than one per period
+        self._scan_future = asyncio.run_coroutine_threadsafe(
+            _run_scan_coros(_get_scan_coros(self._controller)), self._loop
+        )
 
     def stop_scan_futures(self):
-        for future in self._scan_futures:
-            if not future.done():
-                try:
-                    future.cancel()
-                except asyncio.CancelledError:
-                    pass
+        if self._scan_future is not None and not self._scan_future.done():
+            try:
+                self._scan_future.cancel()
+            except asyncio.CancelledError:
+                pass
 
 
 def _link_single_controller_put_tasks(single_mapping: SingleMapping) -> None:
@@ -145,6 +152,12 @@ def _create_updater_callback(attribute, controller):
     return callback
 
 
+async def _run_scan_coros(scan_coros: list[Callable]) -> None:
+    # Exceptions are collected so one failing scan does not orphan the others;
+    # cancelling this coroutine cancels every scan
+    await asyncio.gather(*[coro() for coro in scan_coros], return_exceptions=True)
+
+
 def _get_periodic_scan_coros(scan_dict: dict[float, list[Callable]]) -> list[Callable]:
     periodic_scan_coros: list[Callable] = []
     for period, methods in scan_dict.items():
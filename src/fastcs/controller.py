@@ -3,14 +3,14 @@ from __future__ import annotations
 from collections.abc import Iterator
 from copy import copy
 from dataclasses import dataclass
-from typing import get_type_hints
+from functools import cache
+from typing import Any, get_type_hints
 
 from .attributes import Attribute
-from .cs_methods import Command, Put, Scan
-from .wrappers import WrappedMethod
+from .cs_methods import Command, Method, Put, Scan
 
 
-@dataclass
+@dataclass(slots=True)
 class SingleMapping:
     controller: BaseController
     scan_methods: dict[str, Scan]
@@ -96,19 +96,57 @@ def _walk_mappings(controller: BaseController) -> Iterator[SingleMapping]:
         yield from _walk_mappings(sub_controller)
 
 
+def _get_wrapped_methods(controller: BaseController) -> dict[str, Method]:
+    """Get the fastcs methods of a controller."""
+    methods: dict[str, Method] = {}
+    instance_names = [
+        name
+        for name, attr in vars(controller).items()
+        if isinstance(getattr(attr, "fastcs_method", None), Method)
+    ]
+    attr_names = _get_wrapped_method_names(type(controller))
+    if instance_names:
+        # Keep the alphabetical order dir() used to give
+        attr_names = tuple(sorted({*attr_names, *instance_names}))
+
+    for attr_name in attr_names:
+        # Resolve through the instance so overrides in subclasses are respected
+        method = getattr(getattr(controller, attr_name), "fastcs_method", None)
+        if isinstance(method, Method):
+            methods[attr_name] = method
+
+    return methods
+
+
+@cache
+def _get_wrapped_method_names(controller_class: type) -> tuple[str, ...]:
+    """Get the names of members defined as fastcs methods on a controller class."""
+    names: set[str] = set()
+    for klass in controller_class.__mro__:
+        for name, attr in vars(klass).items():
+            if isinstance(getattr(attr, "fastcs_method", None), Method):
+                names.add(name)
+
+    # Sorted to match the alphabetical order of dir(), which mappings follow
+    return tuple(sorted(names))
+
+
 def _get_single_mapping(controller: BaseController) -> SingleMapping:
     scan_methods: dict[str, Scan] = {}
     put_methods: dict[str, Put] = {}
     command_methods: dict[str, Command] = {}
-    for attr_name in dir(controller):
-        attr = getattr(controller, attr_name)
-        match attr:
-            case WrappedMethod(fastcs_method=Put(enabled=True) as put_method):
-                put_methods[attr_name] = put_method
-            case WrappedMethod(fastcs_method=Scan(enabled=True) as scan_method):
-                scan_methods[attr_name] = scan_method
-            case WrappedMethod(fastcs_method=Command(enabled=True) as command_method):
-                command_methods[attr_name] = command_method
+    methods_by_type: dict[type[Method], dict[str, Any]] = {
+        Put: put_methods,
+        Scan: scan_methods,
+        Command: command_methods,
+    }
+    for attr_name, method in _get_wrapped_methods(controller).items():
+        if method.enabled:
+            # Walk the MRO so that subclasses of the method types are also sorted
+            for method_class in type(method).__mro__:
+                if method_class in methods_by_type:
+                    methods_by_type[method_class][attr_name] = method
+                    break
 
     enabled_attributes = {
         name: attribute
@@ -8,12 +8,29 @@ ScanCallback = Callable[..., Awaitable[None]]
 
 
 class Method:
+    __slots__ = (
+        "_docstring",
+        "_signature",
+        "_parameters",
+        "_return_type",
+        "_fn",
+        "_group",
+        "enabled",
+    )
+
     def __init__(self, fn: Callable, *, group: str | None = None) -> None:
         self._docstring = getdoc(fn)
 
-        sig = signature(fn, eval_str=True)
-        self._parameters = sig.parameters
-        self._return_type = sig.return_annotation
+        # Only the return annotation is needed to validate, so avoid evaluating
+        # string annotations of every parameter unless they are requested
+        self._signature = signature(fn)
+        self._parameters = None
+        self._return_type = self._signature.return_annotation
+        if self._return_type == "None":
+            # `-> None` under `from __future__ import annotations`
+            self._return_type = None
+        elif isinstance(self._return_type, str):
+            self._return_type = signature(fn, eval_str=True).return_annotation
         self._validate(fn)
 
         self._fn = fn
@@ -33,6 +50,8 @@ class Method:
 
     @property
     def parameters(self):
+        if self._parameters is None:
+            self._parameters = signature(self._fn, eval_str=True).parameters
         return self._parameters
 
     @property
@@ -49,6 +68,8 @@ class Method:
 
 
 class Scan(Method):
+    __slots__ = ("_period",)
+
     def __init__(self, fn: Callable, period) -> None:
         super().__init__(fn)
 
@@ -57,7 +78,7 @@ class Scan(Method):
     def _validate(self, fn: Callable) -> None:
         super()._validate(fn)
 
-        if not len(self.parameters) == 1:
+        if not len(self._signature.parameters) == 1:
             raise FastCSException("Scan method cannot have arguments")
 
     @property
@@ -66,22 +87,26 @@ class Scan(Method):
 
 
 class Put(Method):
+    __slots__ = ()
+
     def __init__(self, fn: Callable) -> None:
         super().__init__(fn)
 
     def _validate(self, fn: Callable) -> None:
         super()._validate(fn)
 
-        if not len(self.parameters) == 2:
+        if not len(self._signature.parameters) == 2:
             raise FastCSException("Put method can only take one argument")
 
 
 class Command(Method):
+    __slots__ = ()
+
     def __init__(self, fn: Callable, *, group: str | None = None) -> None:
         super().__init__(fn, group=group)
 
     def _validate(self, fn: Callable) -> None:
         super()._validate(fn)
 
-        if not len(self.parameters) == 1:
+        if not len(self._signature.parameters) == 1:
             raise FastCSException("Command method cannot have arguments")
@@ -1,15 +1,16 @@
 import inspect
-import json
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
-from typing import Annotated, TypeAlias, get_type_hints
+from typing import TYPE_CHECKING, Annotated, TypeAlias
 
 import typer
 from pydantic import BaseModel, create_model
+from pydantic_core import to_json
 from ruamel.yaml import YAML
 
 from fastcs.__main__ import __version__
 
-from .backend import Backend
 from .controller import Controller
 from .exceptions import LaunchError
 from .transport.adapter import TransportAdapter
@@ -18,6 +19,9 @@ from .transport.graphQL.options import GraphQLOptions
 from .transport.rest.options import RestOptions
 from .transport.tango.options import TangoOptions
 
+if TYPE_CHECKING:
+    from softioc.asyncio_dispatcher import AsyncioDispatcher
+
 # Define a type alias for transport options
 TransportOptions: TypeAlias = EpicsOptions | TangoOptions | RestOptions | GraphQLOptions
 
@@ -28,38 +32,23 @@ class FastCS:
         controller: Controller,
         transport_options: TransportOptions,
     ):
+        # Imported here so that importing fastcs does not load softioc
+        from .backend import Backend
+
         self._backend = Backend(controller)
-        self._transport: TransportAdapter
-        match transport_options:
-            case EpicsOptions():
-                from .transport.epics.adapter import EpicsTransport
-
-                self._transport = EpicsTransport(
-                    controller,
-                    self._backend.dispatcher,
-                    transport_options,
-                )
-            case GraphQLOptions():
-                from .transport.graphQL.adapter import GraphQLTransport
-
-                self._transport = GraphQLTransport(
-                    controller,
-                    transport_options,
-                )
-            case TangoOptions():
-                from .transport.tango.adapter import TangoTransport
-
-                self._transport = TangoTransport(
-                    controller,
-                    transport_options,
-                )
-            case RestOptions():
-                from .transport.rest.adapter import RestTransport
-
-                self._transport = RestTransport(
-                    controller,
-                    transport_options,
-                )
+        # Walk the MRO so that subclasses of the options classes are also accepted
+        for options_class in type(transport_options).__mro__:
+            if options_class in _TRANSPORT_FACTORIES:
+                create_transport = _TRANSPORT_FACTORIES[options_class]
+                break
+        else:
+            raise LaunchError(
+                f"Unsupported transport options {type(transport_options).__name__}"
+            )
+
+        self._transport: TransportAdapter = create_transport(
+            controller, self._backend.dispatcher, transport_options
+        )
 
     def create_docs(self) -> None:
         self._transport.create_docs()
@@ -72,6 +61,47 @@ class FastCS:
         self._transport.run()
 
 
+def _create_epics_transport(
+    controller: Controller, dispatcher: "AsyncioDispatcher", options: EpicsOptions
+) -> TransportAdapter:
+    from .transport.epics.adapter import EpicsTransport
+
+    return EpicsTransport(controller, dispatcher, options)
+
+
+def _create_graphql_transport(
+    controller: Controller, dispatcher: "AsyncioDispatcher", options: GraphQLOptions
+) -> TransportAdapter:
+    from .transport.graphQL.adapter import GraphQLTransport
+
+    return GraphQLTransport(controller, options)
+
+
+def _create_tango_transport(
+    controller: Controller, dispatcher: "AsyncioDispatcher", options: TangoOptions
+) -> TransportAdapter:
+    from .transport.tango.adapter import TangoTransport
+
+    return TangoTransport(controller, options)
+
+
+def _create_rest_transport(
+    controller: Controller, dispatcher: "AsyncioDispatcher", options: RestOptions
+) -> TransportAdapter:
+    from .transport.rest.adapter import RestTransport
+
+    return RestTransport(controller, options)
+
+
+# Transport imports are deferred to the factories so only the selected one is loaded
+_TRANSPORT_FACTORIES: dict[type, Callable[..., TransportAdapter]] = {
+    EpicsOptions: _create_epics_transport,
+    GraphQLOptions: _create_graphql_transport,
+    TangoOptions: _create_tango_transport,
+    RestOptions: _create_rest_transport,
+}
+
+
 def launch(
     controller_class: type[Controller],
     version: str | None = None,
@@ -126,7 +156,7 @@ def _launch(
     @launch_typer.command(help=f"Produce json schema for a {controller_class.__name__}")
     def schema(ctx: typer.Context):
         system_schema = ctx.obj.fastcs_options.model_json_schema()
-        print(json.dumps(system_schema, indent=2))
+        print(to_json(system_schema, indent=2).decode())
 
     @launch_typer.command(help=f"Start up a {controller_class.__name__}")
     def run(
@@ -173,9 +203,16 @@ def _launch(
     return launch_typer
 
 
+@cache
 def _extract_options_model(controller_class: type[Controller]) -> type[BaseModel]:
-    sig = inspect.signature(controller_class.__init__)
-    args = inspect.getfullargspec(controller_class.__init__)[0]
+    # Resolve annotations in the same pass instead of also calling get_type_hints
+    sig = inspect.signature(controller_class.__init__, eval_str=True)
+    args = [
+        name
+        for name, parameter in sig.parameters.items()
+        if parameter.kind
+        in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    ]
     if len(args) == 1:
         fastcs_options = create_model(
             f"{controller_class.__name__}",
@@ -183,12 +220,8 @@ def _extract_options_model(controller_class: type[Controller]) -> type[BaseModel
             __config__={"extra": "forbid"},
         )
     elif len(args) == 2:
-        hints = get_type_hints(controller_class.__init__)
-        if "return" in hints:
-            del hints["return"]
-        if hints:
-            options_type = list(hints.values())[-1]
-        else:
+        options_type = sig.parameters[args[-1]].annotation
+        if options_type is inspect.Parameter.empty:
             raise LaunchError(
                 f"Expected typehinting in '{controller_class.__name__}"
                 f".__init__' but received {sig}. Add a typehint for `{args[-1]}`."
@@ -20,7 +20,7 @@ class EpicsTransport(TransportAdapter):
         self._controller = controller
         self._dispatcher = dispatcher
         self._pv_prefix = self.options.ioc.pv_prefix
-        self._ioc = EpicsIOC(self.options.ioc.pv_prefix, controller)
+        self._ioc = EpicsIOC(self.options.ioc.pv_prefix, controller, self.options.ioc)
 
     def create_docs(self) -> None:
         EpicsDocs(self._controller).create_docs(self.options.docs)
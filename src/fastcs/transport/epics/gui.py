@@ -1,3 +1,8 @@
+import logging
+from collections.abc import Callable
+from functools import cache
+from typing import Any, ClassVar, TypeVar
+
 from pvi._format.dls import DLSFormatter
 from pvi.device import (
     LED,
@@ -25,81 +30,117 @@ from pydantic import ValidationError
 from fastcs.attributes import Attribute, AttrR, AttrRW, AttrW
 from fastcs.controller import Controller, SingleMapping, _get_single_mapping
 from fastcs.cs_methods import Command
-from fastcs.datatypes import Bool, Float, Int, String
+from fastcs.datatypes import Bool, DataType, Float, Int, String
 from fastcs.exceptions import FastCSException
 from fastcs.util import snake_to_pascal
 
 from .options import EpicsGUIFormat, EpicsGUIOptions
+from .util import attr_name_to_pv_name
+
+logger = logging.getLogger(__name__)
+
+_Widget = TypeVar("_Widget")
+
+# Widgets with no per-signal state are shared between signals instead of being
+# validated again for every attribute
+_TEXT_READ = TextRead()
+_TEXT_WRITE = TextWrite()
+_READ_WIDGETS: dict[type[DataType], ReadWidgetUnion] = {
+    Bool: LED(),
+    Int: _TEXT_READ,
+    Float: _TEXT_READ,
+    String: TextRead(format=TextFormat.string),
+}
+_WRITE_WIDGETS: dict[type[DataType], WriteWidgetUnion] = {
+    Bool: ToggleButton(),
+    Int: _TEXT_WRITE,
+    Float: _TEXT_WRITE,
+    String: TextWrite(format=TextFormat.string),
+}
+
+
+def _get_widget(widgets: dict[type[DataType], _Widget], datatype: DataType) -> _Widget:
+    # Walk the MRO so that subclasses of the supported datatypes are also accepted
+    for datatype_class in type(datatype).__mro__:
+        if datatype_class in widgets:
+            return widgets[datatype_class]
+
+    raise FastCSException(f"Unsupported type {type(datatype)}: {datatype}")
+
+
+@cache
+def _get_combo_box(choices: tuple[str, ...]) -> ComboBox:
+    """Get a ComboBox, shared between attributes with the same allowed values."""
+    return ComboBox(choices=list(choices))
 
 
 class EpicsGUI:
+    # The formatter only holds layout settings, so one instance serves every screen
+    _formatter: ClassVar[DLSFormatter] = DLSFormatter()
+
     def __init__(self, controller: Controller, pv_prefix: str) -> None:
         self._controller = controller
         self._pv_prefix = pv_prefix
+        self._signal_builders: dict[
+            type[Attribute], Callable[[str, str, Any], SignalR | SignalW | SignalRW]
+        ] = {
+            AttrRW: self._get_signal_rw,
+            AttrR: self._get_signal_r,
+            AttrW: self._get_signal_w,
+        }
 
-    def _get_pv(self, attr_path: list[str], name: str):
-        attr_prefix = ":".join([self._pv_prefix] + attr_path)
-        return f"{attr_prefix}:{name.title().replace('_', '')}"
+    def _get_pv_prefix(self, attr_path: list[str]) -> str:
+        return ":".join((self._pv_prefix, *attr_path))
 
     @staticmethod
     def _get_read_widget(attribute: AttrR) -> ReadWidgetUnion:
-        match attribute.datatype:
-            case Bool():
-                return LED()
-            case Int() | Float():
-                return TextRead()
-            case String():
-                return TextRead(format=TextFormat.string)
-            case datatype:
-                raise FastCSException(f"Unsupported type {type(datatype)}: {datatype}")
+        return _get_widget(_READ_WIDGETS, attribute.datatype)
 
     @staticmethod
     def _get_write_widget(attribute: AttrW) -> WriteWidgetUnion:
         match attribute.allowed_values:
             case allowed_values if allowed_values is not None:
-                return ComboBox(choices=allowed_values)
+                return _get_combo_box(tuple(allowed_values))
             case _:
                 pass
 
-        match attribute.datatype:
-            case Bool():
-                return ToggleButton()
-            case Int() | Float():
-                return TextWrite()
-            case String():
-                return TextWrite(format=TextFormat.string)
-            case datatype:
-                raise FastCSException(f"Unsupported type {type(datatype)}: {datatype}")
+        return _get_widget(_WRITE_WIDGETS, attribute.datatype)
 
     def _get_attribute_component(
-        self, attr_path: list[str], name: str, attribute: Attribute
+        self, pv_prefix: str, name: str, attribute: Attribute
     ) -> SignalR | SignalW | SignalRW:
-        pv = self._get_pv(attr_path, name)
-        name = name.title().replace("_", "")
-
-        match attribute:
-            case AttrRW():
-                read_widget = self._get_read_widget(attribute)
-                write_widget = self._get_write_widget(attribute)
-                return SignalRW(
-                    name=name,
-                    write_pv=pv,
-                    write_widget=write_widget,
-                    read_pv=pv + "_RBV",
-                    read_widget=read_widget,
-                )
-            case AttrR():
-                read_widget = self._get_read_widget(attribute)
-                return SignalR(name=name, read_pv=pv, read_widget=read_widget)
-            case AttrW():
-                write_widget = self._get_write_widget(attribute)
-                return SignalW(name=name, write_pv=pv, write_widget=write_widget)
-            case _:
-                raise FastCSException(f"Unsupported attribute type: {type(attribute)}")
+        name = attr_name_to_pv_name(name)
+        pv = f"{pv_prefix}:{name}"
 
-    def _get_command_component(self, attr_path: list[str], name: str):
-        pv = self._get_pv(attr_path, name)
-        name = name.title().replace("_", "")
+        # Walk the MRO so that AttrRW is found before its AttrR and AttrW bases
+        for attribute_class in type(attribute).__mro__:
+            if attribute_class in self._signal_builders:
+                return self._signal_builders[attribute_class](pv, name, attribute)
+
+        raise FastCSException(f"Unsupported attribute type: {type(attribute)}")
+
+    def _get_signal_rw(self, pv: str, name: str, attribute: AttrRW) -> SignalRW:
+        return SignalRW(
+            name=name,
+            write_pv=pv,
+            write_widget=self._get_write_widget(attribute),
+            read_pv=pv + "_RBV",
+            read_widget=self._get_read_widget(attribute),
+        )
+
+    def _get_signal_r(self, pv: str, name: str, attribute: AttrR) -> SignalR:
+        return SignalR(
+            name=name, read_pv=pv, read_widget=self._get_read_widget(attribute)
+        )
+
+    def _get_signal_w(self, pv: str, name: str, attribute: AttrW) -> SignalW:
+        return SignalW(
+            name=name, write_pv=pv, write_widget=self._get_write_widget(attribute)
+        )
+
+    def _get_command_component(self, pv_prefix: str, name: str):
+        name = attr_name_to_pv_name(name)
+        pv = f"{pv_prefix}:{name}"
 
         return SignalX(
             name=name,
@@ -121,12 +162,12 @@ class EpicsGUI:
         components = self.extract_mapping_components(controller_mapping)
         device = Device(label=options.title, children=components)
 
-        formatter = DLSFormatter()
-        formatter.format(device, options.output_path)
+        self._formatter.format(device, options.output_path)
 
     def extract_mapping_components(self, mapping: SingleMapping) -> Tree:
         components: Tree = []
-        attr_path = mapping.controller.path
+        # Shared by every signal of this controller
+        pv_prefix = self._get_pv_prefix(mapping.controller.path)
 
         for name, sub_controller in mapping.controller.get_sub_controllers().items():
             components.append(
@@ -143,35 +184,31 @@ class EpicsGUI:
         for attr_name, attribute in mapping.attributes.items():
             try:
                 signal = self._get_attribute_component(
-                    attr_path,
+                    pv_prefix,
                     attr_name,
                     attribute,
                 )
             except ValidationError as e:
-                print(f"Invalid name:\n{e}")
+                logger.warning("Invalid name:\n%s", e)
                 continue
 
             match attribute:
                 case Attribute(group=group) if group is not None:
-                    if group not in groups:
-                        groups[group] = []
-
-                    # Remove duplication of group name and signal name
+                    # Remove duplication of group name and signal name. This is
+                    # assigned after construction so that the stripped name is
+                    # not validated, e.g. `motor_2` in group `Motor` becomes `2`
                     signal.name = signal.name.removeprefix(group)
 
-                    groups[group].append(signal)
+                    groups.setdefault(group, []).append(signal)
                 case _:
                     components.append(signal)
 
         for name, command in mapping.command_methods.items():
-            signal = self._get_command_component(attr_path, name)
+            signal = self._get_command_component(pv_prefix, name)
 
             match command:
                 case Command(group=group) if group is not None:
-                    if group not in groups:
-                        groups[group] = []
-
-                    groups[group].append(signal)
+                    groups.setdefault(group, []).append(signal)
                 case _:
                     components.append(signal)
 
@@ -1,5 +1,7 @@
+import logging
 from collections.abc import Callable
-from dataclasses import asdict
+from dataclasses import fields
+from functools import cache
 from types import MethodType
 from typing import Any, Literal
 
@@ -7,13 +9,14 @@ from softioc import builder, softioc
 from softioc.asyncio_dispatcher import AsyncioDispatcher
 from softioc.pythonSoftIoc import RecordWrapper
 
-from fastcs.attributes import AttrR, AttrRW, AttrW
-from fastcs.controller import BaseController, Controller
+from fastcs.attributes import Attribute, AttrR, AttrRW, AttrW
+from fastcs.controller import BaseController, Controller, SingleMapping
 from fastcs.datatypes import Bool, DataType, Float, Int, String, T
 from fastcs.exceptions import FastCSException
 from fastcs.transport.epics.util import (
     MBB_STATE_FIELDS,
     attr_is_enum,
+    attr_name_to_pv_name,
     enum_index_to_value,
     enum_value_to_index,
 )
@@ -22,6 +25,8 @@ from .options import EpicsIOCOptions
 
 EPICS_MAX_NAME_LENGTH = 60
 
+logger = logging.getLogger(__name__)
+
 
 DATATYPE_NAME_TO_RECORD_FIELD = {
     "prec": "PREC",
@@ -35,14 +40,40 @@ DATATYPE_NAME_TO_RECORD_FIELD = {
 }
 
 
+# Names of the softioc builder functions used to create records for each datatype
+INPUT_RECORD_BUILDERS: dict[type[DataType], str] = {
+    Bool: "boolIn",
+    Int: "longIn",
+    Float: "aIn",
+    String: "longStringIn",
+}
+OUTPUT_RECORD_BUILDERS: dict[type[DataType], str] = {
+    Bool: "boolOut",
+    Int: "longOut",
+    Float: "aOut",
+    String: "longStringOut",
+}
+
+
 def datatype_to_epics_fields(datatype: DataType) -> dict[str, Any]:
     return {
-        DATATYPE_NAME_TO_RECORD_FIELD[field]: value
-        for field, value in asdict(datatype).items()
-        if field in DATATYPE_NAME_TO_RECORD_FIELD
+        record_field: getattr(datatype, field)
+        for field, record_field in _get_record_field_pairs(type(datatype))
     }
 
 
+@cache
+def _get_record_field_pairs(
+    datatype_class: type[DataType],
+) -> tuple[tuple[str, str], ...]:
+    """Get the datatype fields with record fields, avoiding a deep copy with asdict."""
+    return tuple(
+        (field.name, DATATYPE_NAME_TO_RECORD_FIELD[field.name])
+        for field in fields(datatype_class)
+        if field.name in DATATYPE_NAME_TO_RECORD_FIELD
+    )
+
+
 class EpicsIOC:
     def __init__(
         self,
@@ -55,8 +86,7 @@ class EpicsIOC:
         _add_pvi_info(f"{pv_prefix}:PVI")
         _add_sub_controller_pvi_info(pv_prefix, controller)
 
-        _create_and_link_attribute_pvs(pv_prefix, controller)
-        _create_and_link_command_pvs(pv_prefix, controller)
+        _create_and_link_pvs(pv_prefix, controller)
 
     def run(
         self,
@@ -71,6 +101,9 @@ class EpicsIOC:
                 "controller": self._controller,
             }
             softioc.interactive_ioc(context)
+        else:
+            # Block until the IOC is stopped without starting an interactive shell
+            softioc.non_interactive_ioc()
 
 
 def _add_pvi_info(
@@ -126,54 +159,70 @@ def _add_sub_controller_pvi_info(pv_prefix: str, parent: BaseController):
         parent: Controller to add PVI refs for
 
     """
-    parent_pvi = ":".join([pv_prefix] + parent.path + ["PVI"])
-
-    for child in parent.get_sub_controllers().values():
-        child_pvi = ":".join([pv_prefix] + child.path + ["PVI"])
-        child_name = child.path[-1].lower()
+    # Walk depth first with an explicit stack instead of recursing
+    parent_pvi = ":".join((pv_prefix, *parent.path, "PVI"))
+    stack = [
+        (parent_pvi, child) for child in reversed(parent.get_sub_controllers().values())
+    ]
+    while stack:
+        parent_pvi, child = stack.pop()
+        child_pvi = ":".join((pv_prefix, *child.path, "PVI"))
+
+        _add_pvi_info(child_pvi, parent_pvi, child.path[-1].lower())
+
+        stack.extend(
+            (child_pvi, grandchild)
+            for grandchild in reversed(child.get_sub_controllers().values())
+        )
 
-        _add_pvi_info(child_pvi, parent_pvi, child_name)
 
-        _add_sub_controller_pvi_info(pv_prefix, child)
+def _create_and_link_pvs(pv_prefix: str, controller: Controller) -> None:
+    # Create attribute and command PVs in a single walk of the controller mappings
+    for single_mapping in controller.get_controller_mappings():
+        _pv_prefix = ":".join((pv_prefix, *single_mapping.controller.path))
+        _create_and_link_attribute_pvs(_pv_prefix, single_mapping)
+        _create_and_link_command_pvs(_pv_prefix, single_mapping)
 
 
-def _create_and_link_attribute_pvs(pv_prefix: str, controller: Controller) -> None:
-    for single_mapping in controller.get_controller_mappings():
-        path = single_mapping.controller.path
-        for attr_name, attribute in single_mapping.attributes.items():
-            pv_name = attr_name.title().replace("_", "")
-            _pv_prefix = ":".join([pv_prefix] + path)
-            full_pv_name_length = len(f"{_pv_prefix}:{pv_name}")
-
-            if full_pv_name_length > EPICS_MAX_NAME_LENGTH:
-                attribute.enabled = False
-                print(
-                    f"Not creating PV for {attr_name} for controller"
-                    f" {single_mapping.controller.path} as full name would exceed"
-                    f" {EPICS_MAX_NAME_LENGTH} characters"
-                )
-                continue
-
-            match attribute:
-                case AttrRW():
-                    if full_pv_name_length > (EPICS_MAX_NAME_LENGTH - 4):
-                        print(
-                            f"Not creating PVs for {attr_name} as _RBV PV"
-                            f" name would exceed {EPICS_MAX_NAME_LENGTH}"
-                            " characters"
-                        )
-                        attribute.enabled = False
-                    else:
-                        _create_and_link_read_pv(
-                            _pv_prefix, f"{pv_name}_RBV", attr_name, attribute
-                        )
-                        _create_and_link_write_pv(
-                            _pv_prefix, pv_name, attr_name, attribute
-                        )
-                case AttrR():
-                    _create_and_link_read_pv(_pv_prefix, pv_name, attr_name, attribute)
-                case AttrW():
-                    _create_and_link_write_pv(_pv_prefix, pv_name, attr_name, attribute)
+def _create_and_link_attribute_pvs(
+    pv_prefix: str, single_mapping: SingleMapping
+) -> None:
+    # Length of the prefix and separator, shared by every PV of this controller
+    prefix_length = len(pv_prefix) + 1
+    for attr_name, attribute in single_mapping.attributes.items():
+        pv_name = attr_name_to_pv_name(attr_name)
+        full_pv_name_length = prefix_length + len(pv_name)
+
+        if full_pv_name_length > EPICS_MAX_NAME_LENGTH:
+            attribute.enabled = False
+            logger.warning(
+                "Not creating PV for %s for controller %s as full name would exceed"
+                " %s characters",
+                attr_name,
+                single_mapping.controller.path,
+                EPICS_MAX_NAME_LENGTH,
+            )
+            continue
+
+        match attribute:
+            case AttrRW():
+                if full_pv_name_length > (EPICS_MAX_NAME_LENGTH - 4):
+                    logger.warning(
+                        "Not creating PVs for %s as _RBV PV name would exceed %s"
+                        " characters",
+                        attr_name,
+                        EPICS_MAX_NAME_LENGTH,
+                    )
+                    attribute.enabled = False
+                else:
+                    _create_and_link_read_pv(
+                        pv_prefix, f"{pv_name}_RBV", attr_name, attribute
+                    )
+                    _create_and_link_write_pv(pv_prefix, pv_name, attr_name, attribute)
+            case AttrR():
+                _create_and_link_read_pv(pv_prefix, pv_name, attr_name, attribute)
+            case AttrW():
+                _create_and_link_write_pv(pv_prefix, pv_name, attr_name, attribute)
 
 
 def _create_and_link_read_pv(
@@ -197,7 +246,7 @@ def _create_and_link_read_pv(
 def _get_input_record(pv: str, attribute: AttrR) -> RecordWrapper:
     attribute_fields = {}
     if attribute.description is not None:
-        attribute_fields.update({"DESC": attribute.description})
+        attribute_fields["DESC"] = attribute.description
 
     if attr_is_enum(attribute):
         assert attribute.allowed_values is not None and all(
@@ -206,38 +255,47 @@ def _get_input_record(pv: str, attribute: AttrR) -> RecordWrapper:
         state_keys = dict(zip(MBB_STATE_FIELDS, attribute.allowed_values, strict=False))
         return builder.mbbIn(pv, **state_keys, **attribute_fields)
 
-    match attribute.datatype:
-        case Bool():
-            record = builder.boolIn(
-                pv, **datatype_to_epics_fields(attribute.datatype), **attribute_fields
-            )
-        case Int():
-            record = builder.longIn(
-                pv,
-                **datatype_to_epics_fields(attribute.datatype),
-                **attribute_fields,
-            )
-        case Float():
-            record = builder.aIn(
-                pv,
-                **datatype_to_epics_fields(attribute.datatype),
-                **attribute_fields,
-            )
-        case String():
-            record = builder.longStringIn(
-                pv, **datatype_to_epics_fields(attribute.datatype), **attribute_fields
-            )
-        case _:
-            raise FastCSException(
-                f"Unsupported type {type(attribute.datatype)}: {attribute.datatype}"
-            )
+    record_builder = _get_record_builder(INPUT_RECORD_BUILDERS, attribute.datatype)
+    # Merge into the freshly built datatype fields to pass a single kwargs mapping
+    record_fields = datatype_to_epics_fields(attribute.datatype)
+    record_fields.update(attribute_fields)
+    record = record_builder(pv, **record_fields)
+
+    _link_datatype_updater(record, attribute, record_fields)
+    return record
+
+
+def _link_datatype_updater(
+    record: RecordWrapper, attribute: Attribute, record_fields: dict[str, Any]
+) -> None:
+    """Set record fields from the attribute datatype whenever it is updated.
+
+    Args:
+        record: Record to set fields on
+        attribute: Attribute to watch for datatype updates
+        record_fields: Fields the record was created with, taken over to track the
+            last value set for each field
+
+    """
 
     def datatype_updater(datatype: DataType):
         for name, value in datatype_to_epics_fields(datatype).items():
-            record.set_field(name, value)
+            if name not in record_fields or record_fields[name] != value:
+                record.set_field(name, value)
+                record_fields[name] = value
 
     attribute.add_update_datatype_callback(datatype_updater)
-    return record
+
+
+def _get_record_builder(
+    builders: dict[type[DataType], str], datatype: DataType
+) -> Callable[..., RecordWrapper]:
+    # Walk the MRO so that subclasses of the supported datatypes are also accepted
+    for datatype_class in type(datatype).__mro__:
+        if datatype_class in builders:
+            return getattr(builder, builders[datatype_class])
+
+    raise FastCSException(f"Unsupported type {type(datatype)}: {datatype}")
 
 
 def _create_and_link_write_pv(
@@ -273,7 +331,7 @@ def _create_and_link_write_pv(
 def _get_output_record(pv: str, attribute: AttrW, on_update: Callable) -> Any:
     attribute_fields = {}
     if attribute.description is not None:
-        attribute_fields.update({"DESC": attribute.description})
+        attribute_fields["DESC"] = attribute.description
     if attr_is_enum(attribute):
         assert attribute.allowed_values is not None and all(
             isinstance(v, str) for v in attribute.allowed_values
@@ -287,66 +345,35 @@ def _get_output_record(pv: str, attribute: AttrW, on_update: Callable) -> Any:
             **attribute_fields,
         )
 
-    match attribute.datatype:
-        case Bool():
-            record = builder.boolOut(
-                pv,
-                **datatype_to_epics_fields(attribute.datatype),
-                always_update=True,
-                on_update=on_update,
-            )
-        case Int():
-            record = builder.longOut(
-                pv,
-                always_update=True,
-                on_update=on_update,
-                **datatype_to_epics_fields(attribute.datatype),
-                **attribute_fields,
-            )
-        case Float():
-            record = builder.aOut(
-                pv,
-                always_update=True,
-                on_update=on_update,
-                **datatype_to_epics_fields(attribute.datatype),
-                **attribute_fields,
-            )
-        case String():
-            record = builder.longStringOut(
-                pv, always_update=True, on_update=on_update, **attribute_fields
-            )
-        case _:
-            raise FastCSException(
-                f"Unsupported type {type(attribute.datatype)}: {attribute.datatype}"
-            )
-
-    def datatype_updater(datatype: DataType):
-        for name, value in datatype_to_epics_fields(datatype).items():
-            record.set_field(name, value)
+    record_builder = _get_record_builder(OUTPUT_RECORD_BUILDERS, attribute.datatype)
+    record_fields = datatype_to_epics_fields(attribute.datatype)
+    record_fields.update(attribute_fields)
+    record = record_builder(
+        pv, always_update=True, on_update=on_update, **record_fields
+    )
 
-    attribute.add_update_datatype_callback(datatype_updater)
+    _link_datatype_updater(record, attribute, record_fields)
     return record
 
 
-def _create_and_link_command_pvs(pv_prefix: str, controller: Controller) -> None:
-    for single_mapping in controller.get_controller_mappings():
-        path = single_mapping.controller.path
-        for attr_name, method in single_mapping.command_methods.items():
-            pv_name = attr_name.title().replace("_", "")
-            _pv_prefix = ":".join([pv_prefix] + path)
-            if len(f"{_pv_prefix}:{pv_name}") > EPICS_MAX_NAME_LENGTH:
-                print(
-                    f"Not creating PV for {attr_name} as full name would exceed"
-                    f" {EPICS_MAX_NAME_LENGTH} characters"
-                )
-                method.enabled = False
-            else:
-                _create_and_link_command_pv(
-                    _pv_prefix,
-                    pv_name,
-                    attr_name,
-                    MethodType(method.fn, single_mapping.controller),
-                )
+def _create_and_link_command_pvs(pv_prefix: str, single_mapping: SingleMapping) -> None:
+    prefix_length = len(pv_prefix) + 1
+    for attr_name, method in single_mapping.command_methods.items():
+        pv_name = attr_name_to_pv_name(attr_name)
+        if prefix_length + len(pv_name) > EPICS_MAX_NAME_LENGTH:
+            logger.warning(
+                "Not creating PV for %s as full name would exceed %s characters",
+                attr_name,
+                EPICS_MAX_NAME_LENGTH,
+            )
+            method.enabled = False
+        else:
+            _create_and_link_command_pv(
+                pv_prefix,
+                pv_name,
+                attr_name,
+                MethodType(method.fn, single_mapping.controller),
+            )
 
 
 def _create_and_link_command_pv(
@@ -363,6 +390,10 @@ def _create_and_link_command_pv(
     _add_attr_pvi_info(record, pv_prefix, attr_name, "x")
 
 
+# Fields shared by the PVI entry of every attribute record
+_ATTR_PVI_FIELD_INFO = {"+channel": "NAME", "+type": "plain"}
+
+
 def _add_attr_pvi_info(
     record: RecordWrapper,
     prefix: str,
@@ -378,15 +409,8 @@ def _add_attr_pvi_info(
         access_mode: Access mode of parameter
 
     """
+    field = f"value.{name}.{access_mode}"
     record.add_info(
         "Q:group",
-        {
-            f"{prefix}:PVI": {
-                f"value.{name}.{access_mode}": {
-                    "+channel": "NAME",
-                    "+type": "plain",
-                    "+trigger": f"value.{name}.{access_mode}",
-                }
-            }
-        },
+        {f"{prefix}:PVI": {field: {**_ATTR_PVI_FIELD_INFO, "+trigger": field}}},
     )
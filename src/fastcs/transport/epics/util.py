@@ -1,28 +1,59 @@
+from functools import cache
+
 from fastcs.attributes import Attribute
 from fastcs.datatypes import String, T
 
-_MBB_FIELD_PREFIXES = (
-    "ZR",
-    "ON",
-    "TW",
-    "TH",
-    "FR",
-    "FV",
-    "SX",
-    "SV",
-    "EI",
-    "NI",
-    "TE",
-    "EL",
-    "TV",
-    "TT",
-    "FT",
-    "FF",
+MBB_STATE_FIELDS = (
+    "ZRST",
+    "ONST",
+    "TWST",
+    "THST",
+    "FRST",
+    "FVST",
+    "SXST",
+    "SVST",
+    "EIST",
+    "NIST",
+    "TEST",
+    "ELST",
+    "TVST",
+    "TTST",
+    "FTST",
+    "FFST",
+)
+MBB_VALUE_FIELDS = (
+    "ZRVL",
+    "ONVL",
+    "TWVL",
+    "THVL",
+    "FRVL",
+    "FVVL",
+    "SXVL",
+    "SVVL",
+    "EIVL",
+    "NIVL",
+    "TEVL",
+    "ELVL",
+    "TVVL",
+    "TTVL",
+    "FTVL",
+    "FFVL",
 )
+MBB_MAX_CHOICES = len(MBB_STATE_FIELDS)
+
 
-MBB_STATE_FIELDS = tuple(f"{p}ST" for p in _MBB_FIELD_PREFIXES)
-MBB_VALUE_FIELDS = tuple(f"{p}VL" for p in _MBB_FIELD_PREFIXES)
-MBB_MAX_CHOICES = len(_MBB_FIELD_PREFIXES)
+@cache
+def attr_name_to_pv_name(attr_name: str) -> str:
+    """Convert the name of an `Attribute` or command to the name of its PV.
+
+    Args:
+        attr_name: The snake_case name the attribute is registered with
+
+    Returns:
+        The PascalCase PV name
+
+    """
+    return attr_name.title().replace("_", "")
 
 
 def attr_is_enum(attribute: Attribute) -> bool:
@@ -1,8 +1,13 @@
 import asyncio
+import sys
 
 import pytest
 
+from fastcs.attributes import AttrW, Sender
 from fastcs.backend import Backend
+from fastcs.controller import Controller
+from fastcs.datatypes import Int
+from fastcs.wrappers import scan
 
 
 class DummyBackend(Backend):
@@ -45,3 +50,51 @@ async def test_backend(controller):
         assert controller.count > count
 
     backend.stop_scan_futures()
+
+    # All scan tasks should be cancelled together
+    await asyncio.sleep(0.05)
+    count = controller.count
+    await asyncio.sleep(0.1)
+    assert controller.count == count
+
+
+class RecordingSender(Sender):
+    async def put(self, controller, attr, value):
+        controller.last_put = value
+
+
+class PutScanController(Controller):
+    value = AttrW(Int(), handler=RecordingSender())
+    last_put = None
+    count = 0
+
+    @scan(0.01)
+    async def counter(self):
+        self.count += 1
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="eager_task_factory requires Python 3.12"
+)
+@pytest.mark.asyncio
+async def test_backend_eager_task_factory():
+    controller = PutScanController()
+    backend = Backend(controller)
+
+    # The factory is installed from the loop thread before the controller is used
+    assert backend._loop.get_task_factory() is asyncio.eager_task_factory  # type: ignore
+
+    backend.run()
+
+    # Puts should still be processed
+    asyncio.run_coroutine_threadsafe(
+        controller.value.process(3), backend._loop
+    ).result()
+    assert controller.last_put == 3
+
+    # Scan tasks should still be running
+    count = controller.count
+    await asyncio.sleep(0.1)
+    assert controller.count > count
+
+    backend.stop_scan_futures()
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import pytest
 
 from fastcs.attributes import AttrR
@@ -7,7 +9,9 @@ from fastcs.controller import (
     _get_single_mapping,
     _walk_mappings,
 )
+from fastcs.cs_methods import Command
 from fastcs.datatypes import Int
+from fastcs.wrappers import command
 
 
 def test_controller_nesting():
@@ -124,3 +128,65 @@ def test_root_attribute():
         ),
     ):
         next(_walk_mappings(FailingController(SomeSubController())))
+
+
+def test_single_mapping_reflects_disabled_methods():
+    class CommandController(Controller):
+        @command()
+        async def do_thing(self):
+            pass
+
+    controller = CommandController()
+
+    mapping = _get_single_mapping(controller)
+    assert list(mapping.command_methods) == ["do_thing"]
+
+    mapping.command_methods["do_thing"].enabled = False
+    assert _get_single_mapping(controller).command_methods == {}
+
+
+def test_single_mapping_methods_are_sorted():
+    class BaseCommandController(Controller):
+        @command()
+        async def zeta(self):
+            pass
+
+        @command()
+        async def alpha(self):
+            pass
+
+    class CommandController(BaseCommandController):
+        @command()
+        async def beta(self):
+            pass
+
+    mapping = _get_single_mapping(CommandController())
+    assert list(mapping.command_methods) == ["alpha", "beta", "zeta"]
+
+
+def test_single_mapping_accepts_method_subclasses():
+    class CustomCommand(Command):
+        pass
+
+    class CommandController(Controller):
+        async def do_thing(self):
+            pass
+
+        do_thing.fastcs_method = CustomCommand(do_thing)  # type: ignore
+
+    mapping = _get_single_mapping(CommandController())
+    assert list(mapping.command_methods) == ["do_thing"]
+
+
+def test_single_mapping_dataclass_controller():
+    @dataclass
+    class DataclassController(Controller):
+        def __post_init__(self):
+            super().__init__()
+
+        @command()
+        async def go(self):
+            pass
+
+    mapping = _get_single_mapping(DataclassController())
+    assert list(mapping.command_methods) == ["go"]
@@ -9,7 +9,14 @@ from typer.testing import CliRunner
 from fastcs.__main__ import __version__
 from fastcs.controller import Controller
 from fastcs.exceptions import LaunchError
-from fastcs.launch import TransportOptions, _launch, launch
+from fastcs.launch import (
+    _TRANSPORT_FACTORIES,
+    FastCS,
+    TransportOptions,
+    _launch,
+    launch,
+)
+from fastcs.transport.rest.options import RestOptions
 
 
 @dataclass
@@ -37,6 +44,16 @@ class ManyArgs(Controller):
         super().__init__()
 
 
+class VarArgs(Controller):
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+
+
+class IsHintedVarArgs(Controller):
+    def __init__(self, arg: SomeConfig, *args, **kwargs) -> None:
+        super().__init__()
+
+
 runner = CliRunner()
 
 
@@ -77,6 +94,39 @@ def test_is_hinted_schema(data):
     #     json.dump(result_dict, f, indent=2)
 
 
+def test_var_args_schema():
+    target_model = create_model(
+        "VarArgs",
+        transport=(TransportOptions, ...),
+        __config__={"extra": "forbid"},
+    )
+    target_dict = target_model.model_json_schema()
+
+    app = _launch(VarArgs)
+    result = runner.invoke(app, ["schema"])
+    assert result.exit_code == 0
+    result_dict = json.loads(result.stdout)
+
+    assert result_dict == target_dict
+
+
+def test_is_hinted_var_args_schema():
+    target_model = create_model(
+        "IsHintedVarArgs",
+        controller=(SomeConfig, ...),
+        transport=(TransportOptions, ...),
+        __config__={"extra": "forbid"},
+    )
+    target_dict = target_model.model_json_schema()
+
+    app = _launch(IsHintedVarArgs)
+    result = runner.invoke(app, ["schema"])
+    assert result.exit_code == 0
+    result_dict = json.loads(result.stdout)
+
+    assert result_dict == target_dict
+
+
 def test_not_hinted_schema():
     error = (
         "Expected typehinting in 'NotHinted.__init__' but received "
@@ -143,3 +193,21 @@ def test_launch_full(mocker: MockerFixture, data):
     run.assert_called_once()
     gui.assert_called_once()
     docs.assert_called_once()
+
+
+def test_unsupported_transport_options():
+    with pytest.raises(LaunchError, match="Unsupported transport options SomeConfig"):
+        FastCS(SingleArg(), SomeConfig("name"))  # type: ignore
+
+
+def test_transport_options_subclass(mocker: MockerFixture):
+    class CustomRestOptions(RestOptions):
+        pass
+
+    create_transport = mocker.MagicMock()
+    mocker.patch.dict(_TRANSPORT_FACTORIES, {RestOptions: create_transport})
+
+    options = CustomRestOptions()
+    FastCS(SingleArg(), options)
+
+    create_transport.assert_called_once_with(mocker.ANY, mocker.ANY, options)
@@ -2,6 +2,7 @@ from pvi.device import (
     LED,
     ButtonPanel,
     ComboBox,
+    Grid,
     Group,
     SignalR,
     SignalRW,
@@ -14,15 +15,18 @@ from pvi.device import (
     ToggleButton,
 )
 
+from fastcs.attributes import AttrR
+from fastcs.controller import Controller
+from fastcs.datatypes import Int
 from fastcs.transport.epics.gui import EpicsGUI
 
 
-def test_get_pv(controller):
+def test_get_pv_prefix(controller):
     gui = EpicsGUI(controller, "DEVICE")
 
-    assert gui._get_pv([], "A") == "DEVICE:A"
-    assert gui._get_pv(["B"], "C") == "DEVICE:B:C"
-    assert gui._get_pv(["D", "E"], "F") == "DEVICE:D:E:F"
+    assert gui._get_pv_prefix([]) == "DEVICE"
+    assert gui._get_pv_prefix(["B"]) == "DEVICE:B"
+    assert gui._get_pv_prefix(["D", "E"]) == "DEVICE:D:E"
 
 
 def test_get_components(controller):
@@ -92,3 +96,45 @@ def test_get_components(controller):
             value="1",
         ),
     ]
+
+
+def test_get_components_group():
+    class GroupController(Controller):
+        motor_speed = AttrR(Int(), group="Motor")
+
+    controller = GroupController()
+    gui = EpicsGUI(controller, "DEVICE")
+
+    components = gui.extract_mapping_components(controller.get_controller_mappings()[0])
+    assert components == [
+        Group(
+            name="Motor",
+            layout=Grid(),
+            children=[
+                SignalR(
+                    name="Speed", read_pv="DEVICE:MotorSpeed", read_widget=TextRead()
+                )
+            ],
+        )
+    ]
+
+
+def test_get_components_group_invalid_stripped_name():
+    class GroupController(Controller):
+        motor_2 = AttrR(Int(), group="Motor")
+
+    controller = GroupController()
+    gui = EpicsGUI(controller, "DEVICE")
+
+    components = gui.extract_mapping_components(controller.get_controller_mappings()[0])
+    assert components == [
+        Group(
+            name="Motor",
+            layout=Grid(),
+            children=[
+                SignalR.model_construct(
+                    name="2", read_pv="DEVICE:Motor2", read_widget=TextRead()
+                )
+            ],
+        )
+    ]
@@ -4,7 +4,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from fastcs.attributes import AttrR, AttrRW, AttrW
-from fastcs.controller import Controller
+from fastcs.controller import Controller, SubController
 from fastcs.cs_methods import Command
 from fastcs.datatypes import Int, String
 from fastcs.exceptions import FastCSException
@@ -19,6 +19,7 @@ from fastcs.transport.epics.ioc import (
     _get_input_record,
     _get_output_record,
 )
+from fastcs.transport.epics.options import EpicsIOCOptions
 
 DEVICE = "DEVICE"
 
@@ -276,6 +277,25 @@ def test_ioc(mocker: MockerFixture, controller: Controller):
     add_sub_controller_pvi_info.assert_called_once_with(DEVICE, controller)
 
 
+@pytest.mark.parametrize("terminal", [True, False])
+def test_ioc_run_terminal(mocker: MockerFixture, controller: Controller, terminal):
+    mocker.patch("fastcs.transport.epics.ioc.builder")
+    softioc = mocker.patch("fastcs.transport.epics.ioc.softioc")
+    dispatcher = mocker.MagicMock()
+
+    EpicsIOC(DEVICE, controller, EpicsIOCOptions(terminal=terminal)).run(dispatcher)
+
+    softioc.iocInit.assert_called_once_with(dispatcher)
+    if terminal:
+        softioc.interactive_ioc.assert_called_once_with(
+            {"dispatcher": dispatcher, "controller": controller}
+        )
+        softioc.non_interactive_ioc.assert_not_called()
+    else:
+        softioc.interactive_ioc.assert_not_called()
+        softioc.non_interactive_ioc.assert_called_once_with()
+
+
 def test_add_pvi_info(mocker: MockerFixture):
     builder = mocker.patch("fastcs.transport.epics.ioc.builder")
     controller = mocker.MagicMock()
@@ -355,6 +375,26 @@ def test_add_sub_controller_pvi_info(mocker: MockerFixture):
     )
 
 
+def test_add_sub_controller_pvi_info_nested_in_init(mocker: MockerFixture):
+    add_pvi_info = mocker.patch("fastcs.transport.epics.ioc._add_pvi_info")
+
+    class Outer(SubController):
+        def __init__(self):
+            super().__init__()
+            # Registered before Outer has a path, so Inner's path is just ["Inner"]
+            self.register_sub_controller("Inner", SubController())
+
+    controller = Controller()
+    controller.register_sub_controller("Outer", Outer())
+
+    _add_sub_controller_pvi_info(DEVICE, controller)
+
+    assert add_pvi_info.call_args_list == [
+        mocker.call(f"{DEVICE}:Outer:PVI", f"{DEVICE}:PVI", "outer"),
+        mocker.call(f"{DEVICE}:Inner:PVI", f"{DEVICE}:Outer:PVI", "inner"),
+    ]
+
+
 def test_add_attr_pvi_info(mocker: MockerFixture):
     record = mocker.MagicMock()
 
@@ -489,3 +529,16 @@ def test_update_datatype(mocker: MockerFixture):
         match="Attribute datatype must be of type <class 'fastcs.datatypes.Int'>",
     ):
         attr_w.update_datatype(String())  # type: ignore
+
+
+def test_update_datatype_sets_changed_fields(mocker: MockerFixture):
+    mocker.patch("fastcs.transport.epics.ioc.builder")
+
+    attr = AttrR(Int(units="m"))
+    record = _get_input_record(f"{DEVICE}:Attr", attr)
+
+    attr.update_datatype(Int(units="m"))
+    record.set_field.assert_not_called()
+
+    attr.update_datatype(Int(units="mm"))
+    record.set_field.assert_called_once_with("EGU", "mm")
@@ -4,11 +4,17 @@ from fastcs.attributes import AttrR
 from fastcs.datatypes import String
 from fastcs.transport.epics.util import (
     attr_is_enum,
+    attr_name_to_pv_name,
     enum_index_to_value,
     enum_value_to_index,
 )
 
 
+def test_attr_name_to_pv_name():
+    assert attr_name_to_pv_name("read_int") == "ReadInt"
+    assert attr_name_to_pv_name("go") == "Go"
+
+
 def test_attr_is_enum():
     assert not attr_is_enum(AttrR(String()))
     assert attr_is_enum(AttrR(String(), allowed_values=["disabled", "enabled"]))